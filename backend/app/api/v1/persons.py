@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, func, delete
 
+from app.core.admission import admitted
 from app.core.db import get_db
 from app.models.person import Person
 from app.schemas.person import PersonCreate, PersonUpdate, PersonRead
@@ -21,8 +22,9 @@ async def get_persons(
     Récupère la liste de toutes les personnes avec pagination.
     """
     stmt = select(Person).offset(skip).limit(limit).order_by(Person.created_at.desc())
-    result = await db.execute(stmt)
-    persons = result.scalars().all()
+    async with admitted("read", db):
+        result = await db.execute(stmt)
+        persons = result.scalars().all()
     return persons
 
 
@@ -57,8 +59,9 @@ async def search_persons(
         .order_by(Person.first_name, Person.last_name)
     )
 
-    result = await db.execute(stmt)
-    persons = result.scalars().all()
+    async with admitted("search", db):
+        result = await db.execute(stmt)
+        persons = result.scalars().all()
 
     return persons
 
@@ -74,8 +77,9 @@ async def get_person(
     Récupère une personne spécifique par son UUID.
     """
     stmt = select(Person).where(Person.id == person_id)
-    result = await db.execute(stmt)
-    person = result.scalar_one_or_none()
+    async with admitted("read", db):
+        result = await db.execute(stmt)
+        person = result.scalar_one_or_none()
 
     if not person:
         raise HTTPException(status_code=404, detail="Personne non trouvée")
@@ -96,21 +100,22 @@ async def create_person(
     """
     Crée une nouvelle personne dans la base de données.
     """
-    # Vérifier si l'email existe déjà (si fourni)
-    if person_data.email:
-        stmt = select(Person).where(Person.email == person_data.email)
-        result = await db.execute(stmt)
-        existing_person = result.scalar_one_or_none()
-        if existing_person:
-            raise HTTPException(
-                status_code=400, detail="Une personne avec cet email existe déjà"
-            )
-
-    # Créer la nouvelle personne
-    person = Person(**person_data.model_dump())
-    db.add(person)
-    await db.commit()
-    await db.refresh(person)
+    async with admitted("write", db):
+        # Vérifier si l'email existe déjà (si fourni)
+        if person_data.email:
+            stmt = select(Person).where(Person.email == person_data.email)
+            result = await db.execute(stmt)
+            existing_person = result.scalar_one_or_none()
+            if existing_person:
+                raise HTTPException(
+                    status_code=400, detail="Une personne avec cet email existe déjà"
+                )
+
+        # Créer la nouvelle personne
+        person = Person(**person_data.model_dump())
+        db.add(person)
+        await db.commit()
+        await db.refresh(person)
 
     return person
 
@@ -126,31 +131,32 @@ async def update_person(
     """
     Met à jour les informations d'une personne existante.
     """
-    # Récupérer la personne existante
-    stmt = select(Person).where(Person.id == person_id)
-    result = await db.execute(stmt)
-    person = result.scalar_one_or_none()
+    async with admitted("write", db):
+        # Récupérer la personne existante
+        stmt = select(Person).where(Person.id == person_id)
+        result = await db.execute(stmt)
+        person = result.scalar_one_or_none()
 
-    if not person:
-        raise HTTPException(status_code=404, detail="Personne non trouvée")
+        if not person:
+            raise HTTPException(status_code=404, detail="Personne non trouvée")
 
-    # Vérifier l'unicité de l'email si modifié
-    if person_data.email and person_data.email != person.email:
-        stmt = select(Person).where(Person.email == person_data.email)
-        result = await db.execute(stmt)
-        existing_person = result.scalar_one_or_none()
-        if existing_person:
-            raise HTTPException(
-                status_code=400, detail="Une personne avec cet email existe déjà"
-            )
+        # Vérifier l'unicité de l'email si modifié
+        if person_data.email and person_data.email != person.email:
+            stmt = select(Person).where(Person.email == person_data.email)
+            result = await db.execute(stmt)
+            existing_person = result.scalar_one_or_none()
+            if existing_person:
+                raise HTTPException(
+                    status_code=400, detail="Une personne avec cet email existe déjà"
+                )
 
-    # Mettre à jour les champs modifiés
-    update_data = person_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(person, field, value)
+        # Mettre à jour les champs modifiés
+        update_data = person_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(person, field, value)
 
-    await db.commit()
-    await db.refresh(person)
+        await db.commit()
+        await db.refresh(person)
 
     return person
 
@@ -163,15 +169,16 @@ async def delete_person(
     """
     Supprime une personne de la base de données.
     """
-    # Vérifier que la personne existe
-    stmt = select(Person).where(Person.id == person_id)
-    result = await db.execute(stmt)
-    person = result.scalar_one_or_none()
+    async with admitted("write", db):
+        # Vérifier que la personne existe
+        stmt = select(Person).where(Person.id == person_id)
+        result = await db.execute(stmt)
+        person = result.scalar_one_or_none()
 
-    if not person:
-        raise HTTPException(status_code=404, detail="Personne non trouvée")
+        if not person:
+            raise HTTPException(status_code=404, detail="Personne non trouvée")
 
-    # Supprimer la personne
-    stmt = delete(Person).where(Person.id == person_id)
-    await db.execute(stmt)
-    await db.commit()
+        # Supprimer la personne
+        stmt = delete(Person).where(Person.id == person_id)
+        await db.execute(stmt)
+        await db.commit()
@@ -0,0 +1,204 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+
+
+@dataclass
+class AdmissionClass:
+    """Classe de routes partageant une limite de concurrence et une file d'attente"""
+
+    # Plus la valeur est basse, plus la classe est servie en priorité
+    priority: int
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+    retry_after: int
+    # Places globales que cette classe doit laisser libres (réservées aux lectures)
+    reserved_headroom: int = 0
+
+    in_flight: int = 0
+    admitted: int = 0
+    shed_queue_full: int = 0
+    shed_timeout: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+
+
+class AdmissionController:
+    """
+    Contrôle d'admission devant le pool de connexions à la base de données.
+
+    Une requête n'obtient une session que si une place est libre à la fois
+    globalement et dans sa classe. Sinon elle attend dans une file bornée ;
+    quand une place se libère, la classe la plus prioritaire est servie en
+    premier (FIFO au sein d'une classe). Les écritures et les recherches ne
+    peuvent pas occuper les dernières places, réservées aux lectures. Une
+    requête dont la file est pleine ou dont l'attente dépasse le délai est
+    rejetée immédiatement en 503 avec un en-tête Retry-After, plutôt que de
+    bloquer sur le pool.
+    """
+
+    def __init__(self, capacity: int, classes: Dict[str, AdmissionClass]):
+        self.capacity = capacity
+        self.in_flight = 0
+        self._classes = classes
+        self._by_priority = sorted(classes.values(), key=lambda c: c.priority)
+
+    def _reserved(self, cls: AdmissionClass) -> int:
+        # Une réserve supérieure à la capacité bloquerait la classe même à vide
+        return min(cls.reserved_headroom, max(self.capacity - 1, 0))
+
+    def _effective_cap(self, cls: AdmissionClass) -> int:
+        return min(cls.max_concurrency, self.capacity - self._reserved(cls))
+
+    def _has_room(self, cls: AdmissionClass) -> bool:
+        return (
+            self.in_flight < self.capacity - self._reserved(cls)
+            and cls.in_flight < cls.max_concurrency
+        )
+
+    def _grant(self, cls: AdmissionClass) -> None:
+        self.in_flight += 1
+        cls.in_flight += 1
+        cls.admitted += 1
+
+    def _dispatch(self) -> None:
+        while self.in_flight < self.capacity:
+            for cls in self._by_priority:
+                # Écarter les attentes annulées qui n'ont pas encore été retirées
+                while cls.waiters and cls.waiters[0].done():
+                    cls.waiters.popleft()
+                if cls.waiters and self._has_room(cls):
+                    cls.waiters.popleft().set_result(None)
+                    self._grant(cls)
+                    break
+            else:
+                return
+
+    def _shed(self, cls: AdmissionClass) -> HTTPException:
+        return HTTPException(
+            status_code=503,
+            detail="Service momentanément surchargé, veuillez réessayer",
+            headers={"Retry-After": str(cls.retry_after)},
+        )
+
+    async def acquire(self, name: str) -> None:
+        cls = self._classes[name]
+
+        if not cls.waiters and self._has_room(cls):
+            self._grant(cls)
+            return
+
+        if len(cls.waiters) >= cls.max_queue:
+            cls.shed_queue_full += 1
+            raise self._shed(cls)
+
+        waiter = asyncio.get_running_loop().create_future()
+        cls.waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(cls.queue_timeout):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # La place a été accordée au moment même de l'expiration
+                if isinstance(exc, asyncio.CancelledError):
+                    self.release(name)
+                    raise
+            else:
+                if waiter in cls.waiters:
+                    cls.waiters.remove(waiter)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                cls.shed_timeout += 1
+                raise self._shed(cls) from None
+        finally:
+            waited = time.monotonic() - started
+            cls.total_wait += waited
+            cls.max_wait = max(cls.max_wait, waited)
+
+    def release(self, name: str) -> None:
+        cls = self._classes[name]
+        self.in_flight -= 1
+        cls.in_flight -= 1
+        self._dispatch()
+
+    def snapshot(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "classes": {
+                name: {
+                    "priority": cls.priority,
+                    "max_concurrency": cls.max_concurrency,
+                    "reserved_headroom": self._reserved(cls),
+                    "effective_max_concurrency": self._effective_cap(cls),
+                    "in_flight": cls.in_flight,
+                    "queued": len(cls.waiters),
+                    "admitted": cls.admitted,
+                    "shed_queue_full": cls.shed_queue_full,
+                    "shed_timeout": cls.shed_timeout,
+                    "max_wait_seconds": round(cls.max_wait, 4),
+                    "total_wait_seconds": round(cls.total_wait, 4),
+                }
+                for name, cls in self._classes.items()
+            },
+        }
+
+
+admission_controller = AdmissionController(
+    capacity=settings.ADMISSION_MAX_CONCURRENCY,
+    classes={
+        # Lectures unitaires et paginées : prioritaires
+        "read": AdmissionClass(
+            priority=0,
+            max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            retry_after=settings.ADMISSION_RETRY_AFTER,
+        ),
+        "write": AdmissionClass(
+            priority=1,
+            max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            retry_after=settings.ADMISSION_RETRY_AFTER,
+            reserved_headroom=settings.ADMISSION_READ_RESERVED,
+        ),
+        # Recherches et exports : coûteux, plafonnés et délestés en premier
+        "search": AdmissionClass(
+            priority=2,
+            max_concurrency=settings.ADMISSION_SEARCH_MAX_CONCURRENCY,
+            max_queue=settings.ADMISSION_SEARCH_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_SEARCH_QUEUE_TIMEOUT,
+            retry_after=settings.ADMISSION_RETRY_AFTER,
+            reserved_headroom=settings.ADMISSION_READ_RESERVED,
+        ),
+    },
+)
+
+
+@asynccontextmanager
+async def admitted(name: str, db: AsyncSession) -> AsyncIterator[None]:
+    """
+    Réserve une place de la classe `name` autour du travail en base.
+
+    Utilisé dans le corps des routes, après la validation des paramètres :
+    une requête rejetée en 422 ne consomme ni place ni attente. La session
+    est fermée en sortie pour rendre la connexion au pool avec la place.
+    """
+    await admission_controller.acquire(name)
+    try:
+        yield
+    finally:
+        await db.close()
+        admission_controller.release(name)
@@ -20,6 +20,27 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = os.getenv("POSTGRES_USER", "smc")
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "smc")
 
+    # Pool de connexions SQLAlchemy
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+
+    # Contrôle d'admission (par défaut, autant de requêtes que de connexions)
+    ADMISSION_MAX_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_MAX_CONCURRENCY", DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    )
+    # Places laissées libres pour les lectures (écritures et recherches exclues)
+    ADMISSION_READ_RESERVED: int = int(os.getenv("ADMISSION_READ_RESERVED", 3))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", 50))
+    ADMISSION_QUEUE_TIMEOUT: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 2.0))
+    ADMISSION_SEARCH_MAX_CONCURRENCY: int = int(
+        os.getenv("ADMISSION_SEARCH_MAX_CONCURRENCY", 5)
+    )
+    ADMISSION_SEARCH_MAX_QUEUE: int = int(os.getenv("ADMISSION_SEARCH_MAX_QUEUE", 10))
+    ADMISSION_SEARCH_QUEUE_TIMEOUT: float = float(
+        os.getenv("ADMISSION_SEARCH_QUEUE_TIMEOUT", 0.5)
+    )
+    ADMISSION_RETRY_AFTER: int = int(os.getenv("ADMISSION_RETRY_AFTER", 1))
+
     CORS_ORIGINS: str = "*"  # comma-separated
 
     @property
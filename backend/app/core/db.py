@@ -4,7 +4,13 @@ from sqlalchemy.orm import DeclarativeBase
 from .config import settings
 
 # Async engine using asyncpg driver
-engine = create_async_engine(settings.ASYNC_DATABASE_URL, echo=False, future=True)
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
 AsyncSessionLocal = async_sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
 )
@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from app.api.v1.persons import router as persons_router
+from app.core.admission import admission_controller
 
 
 def _get_bool(env_name: str, default: bool = False) -> bool:
@@ -91,6 +92,12 @@ async def readyz():
     return {"status": "ready"}
 
 
+@app.get("/admissionz", tags=["meta"])
+async def admissionz():
+    # Admission control counters (in-flight, queued, shed) for capacity tuning
+    return admission_controller.snapshot()
+
+
 # TODO: include your routers here
 app.include_router(persons_router, prefix="/api/v1/persons", tags=["persons"])
 
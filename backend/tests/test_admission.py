@@ -0,0 +1,262 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core import admission
+from app.core.admission import AdmissionClass, AdmissionController
+
+
+def _controller(
+    capacity: int = 1,
+    queue_timeout: float = 1.0,
+    max_queue: int = 10,
+    search_max_concurrency: int = 1,
+    reserved: int = 0,
+) -> AdmissionController:
+    return AdmissionController(
+        capacity=capacity,
+        classes={
+            "read": AdmissionClass(
+                priority=0,
+                max_concurrency=capacity,
+                max_queue=max_queue,
+                queue_timeout=queue_timeout,
+                retry_after=3,
+            ),
+            "write": AdmissionClass(
+                priority=1,
+                max_concurrency=capacity,
+                max_queue=max_queue,
+                queue_timeout=queue_timeout,
+                retry_after=3,
+                reserved_headroom=reserved,
+            ),
+            "search": AdmissionClass(
+                priority=2,
+                max_concurrency=search_max_concurrency,
+                max_queue=max_queue,
+                queue_timeout=queue_timeout,
+                retry_after=3,
+                reserved_headroom=reserved,
+            ),
+        },
+    )
+
+
+def test_fast_path_grant():
+    async def scenario():
+        c = _controller()
+        await c.acquire("read")
+        stats = c.snapshot()
+        assert stats["in_flight"] == 1
+        assert stats["classes"]["read"]["admitted"] == 1
+        assert stats["classes"]["read"]["queued"] == 0
+        c.release("read")
+        assert c.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_shed_when_queue_full():
+    async def scenario():
+        c = _controller(max_queue=0)
+        await c.acquire("read")
+        with pytest.raises(HTTPException) as exc_info:
+            await c.acquire("read")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        assert c.snapshot()["classes"]["read"]["shed_queue_full"] == 1
+        c.release("read")
+        assert c.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_shed_after_queue_timeout():
+    async def scenario():
+        c = _controller(queue_timeout=0.05)
+        await c.acquire("read")
+        with pytest.raises(HTTPException) as exc_info:
+            await c.acquire("read")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "3"}
+        stats = c.snapshot()["classes"]["read"]
+        assert stats["shed_timeout"] == 1
+        assert stats["queued"] == 0
+        c.release("read")
+        assert c.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_dispatch_by_priority():
+    async def scenario():
+        c = _controller()
+        order = []
+
+        async def job(name):
+            await c.acquire(name)
+            order.append(name)
+            await asyncio.sleep(0)
+            c.release(name)
+
+        await c.acquire("read")
+        tasks = [asyncio.create_task(job(n)) for n in ("search", "write", "read")]
+        await asyncio.sleep(0)
+        c.release("read")
+        await asyncio.gather(*tasks)
+        assert order == ["read", "write", "search"]
+        assert c.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_search_cap_enforced():
+    async def scenario():
+        c = _controller(capacity=5, queue_timeout=0.05, search_max_concurrency=1)
+        await c.acquire("search")
+        with pytest.raises(HTTPException):
+            await c.acquire("search")
+        assert c.snapshot()["classes"]["search"]["shed_timeout"] == 1
+        # Les autres classes ne sont pas concernées par le plafond des recherches
+        await c.acquire("read")
+        assert c.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+def test_reads_keep_reserved_headroom():
+    async def scenario():
+        c = _controller(capacity=3, queue_timeout=0.05, reserved=1)
+        await c.acquire("write")
+        await c.acquire("write")
+        with pytest.raises(HTTPException):
+            await c.acquire("write")
+        await c.acquire("read")
+        assert c.in_flight == 3
+
+    asyncio.run(scenario())
+
+
+def test_small_pool_caps_reserved_headroom():
+    async def scenario():
+        # Pool de 2 connexions avec une réserve de 3 : écritures et recherches
+        # doivent tout de même passer sur un serveur au repos
+        c = _controller(capacity=2, queue_timeout=0.05, reserved=3)
+        await c.acquire("write")
+        c.release("write")
+        await c.acquire("search")
+        stats = c.snapshot()["classes"]
+        assert stats["search"]["reserved_headroom"] == 1
+        assert stats["search"]["effective_max_concurrency"] == 1
+        with pytest.raises(HTTPException):
+            await c.acquire("write")
+        await c.acquire("read")
+        assert c.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+def test_snapshot_reports_effective_cap():
+    c = _controller(capacity=15, search_max_concurrency=5, reserved=3)
+    stats = c.snapshot()["classes"]
+    assert stats["read"]["reserved_headroom"] == 0
+    assert stats["read"]["effective_max_concurrency"] == 15
+    assert stats["write"]["max_concurrency"] == 15
+    assert stats["write"]["reserved_headroom"] == 3
+    assert stats["write"]["effective_max_concurrency"] == 12
+    assert stats["search"]["effective_max_concurrency"] == 5
+
+
+def test_cancelled_waiter_released_same_tick():
+    async def scenario():
+        c = _controller()
+        await c.acquire("read")
+        task = asyncio.create_task(c.acquire("read"))
+        await asyncio.sleep(0)
+        task.cancel()
+        c.release("read")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        stats = c.snapshot()
+        assert stats["in_flight"] == 0
+        assert stats["classes"]["read"]["queued"] == 0
+        await c.acquire("read")
+        assert c.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_timed_out_waiter_released_same_tick():
+    async def scenario():
+        c = _controller(queue_timeout=0.05)
+        await c.acquire("read")
+        task = asyncio.create_task(c.acquire("read"))
+        await asyncio.sleep(0)
+        # L'expiration du délai puis la libération passent dans la même itération
+        asyncio.get_running_loop().call_later(0.05, c.release, "read")
+        time.sleep(0.1)
+        with pytest.raises(HTTPException) as exc_info:
+            await task
+        assert exc_info.value.status_code == 503
+        stats = c.snapshot()
+        assert stats["in_flight"] == 0
+        assert stats["classes"]["read"]["queued"] == 0
+        assert stats["classes"]["read"]["shed_timeout"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_admitted_releases_slot_and_closes_session(monkeypatch):
+    class _Session:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    async def scenario():
+        c = _controller()
+        monkeypatch.setattr(admission, "admission_controller", c)
+        db = _Session()
+        with pytest.raises(HTTPException):
+            async with admission.admitted("read", db):
+                assert c.in_flight == 1
+                raise HTTPException(status_code=404)
+        assert db.closed
+        assert c.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_saturated_route_returns_503(monkeypatch):
+    from main import app
+
+    saturated = _controller(capacity=0, max_queue=0)
+    monkeypatch.setattr(admission, "admission_controller", saturated)
+
+    response = TestClient(app).get("/api/v1/persons/")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert saturated.snapshot()["classes"]["read"]["shed_queue_full"] == 1
+
+
+def test_invalid_request_does_not_take_slot(monkeypatch):
+    from main import app
+
+    saturated = _controller(capacity=0, max_queue=0)
+    monkeypatch.setattr(admission, "admission_controller", saturated)
+    client = TestClient(app)
+
+    # La validation passe avant l'admission : 422 immédiat, sans place ni attente
+    assert client.get("/api/v1/persons/search?q=").status_code == 422
+    assert client.get("/api/v1/persons/not-a-uuid").status_code == 422
+    assert client.post("/api/v1/persons/", json={}).status_code == 422
+    stats = saturated.snapshot()
+    assert stats["in_flight"] == 0
+    for cls in stats["classes"].values():
+        assert cls["admitted"] == 0
+        assert cls["shed_queue_full"] == 0
+        assert cls["shed_timeout"] == 0